@@ -18,8 +18,40 @@ ITEMS_BASE_PATH = "aigame/data/items"
 
 console = Console()
 
+# Tools available to NPCs during regular conversation
+NPC_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "give_item_to_player",
+            "description": "Give an item from your inventory to the player",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "item_name": {
+                        "type": "string",
+                        "description": "The exact name of the item to give to the player"
+                    }
+                },
+                "required": ["item_name"]
+            }
+        }
+    }
+]
+
 if TYPE_CHECKING:
     from .player import Player
+    from .npc_action_parser import NPCActionParser
+
+# Shared NPC action parser; created on first use because npc_action_parser imports this module
+_npc_action_parser: NPCActionParser | None = None
+
+def _get_npc_action_parser() -> NPCActionParser:
+    global _npc_action_parser
+    if _npc_action_parser is None:
+        from .npc_action_parser import NPCActionParser
+        _npc_action_parser = NPCActionParser(debug_mode=False)
+    return _npc_action_parser
 
 class Character:
     def __init__(self, name: str, personality: str, goal: str, disposition: str, items: list[Item]):
@@ -125,7 +157,7 @@ class Character:
         )
         
         # Add scenario setting context if available
-        if scenario and hasattr(scenario, 'setting'):
+        if scenario:
             system_message_content += (
                 f"\n🌍 WORLD CONTEXT: {scenario.setting}\n"
                 f"This world context should inform your behavior, dialogue style, and decision-making. "
@@ -367,34 +399,13 @@ class Character:
         # Regular conversation - prepare messages
         current_messages = self._prepare_llm_messages(current_location, scenario)
 
-        # Define available tools for the NPC
-        active_tools = [
-            {
-                "type": "function",
-                "function": {
-                    "name": "give_item_to_player",
-                    "description": "Give an item from your inventory to the player",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "item_name": {
-                                "type": "string",
-                                "description": "The exact name of the item to give to the player"
-                            }
-                        },
-                        "required": ["item_name"]
-                    }
-                }
-            }
-        ]
-
         debug_llm_call("Character", f"Dialogue generation for {self.name}", DEFAULT_LLM_MODEL)
 
         try:
             response = litellm.completion(
                 model=DEFAULT_LLM_MODEL,
                 messages=current_messages,
-                tools=active_tools,
+                tools=NPC_TOOLS,
                 tool_choice="auto"
             )
 
@@ -479,7 +490,6 @@ class Character:
         Enhanced version that generates AI response and parses actions from natural language.
         Returns (spoken_response, action_results_dict)
         """
-        from .npc_action_parser import NPCActionParser
         from .player import Player
         
         # Validate arguments
@@ -507,11 +517,11 @@ class Character:
                 return None, {'executed_actions': [], 'state_changes': {}, 'errors': ['Empty AI response']}
             
             # Parse the response for actions without debug mode (we handle debug at higher level)
-            parser = NPCActionParser(debug_mode=False)
+            parser = _get_npc_action_parser()
             context = {
-                'active_offer': getattr(self, 'active_offer', None),
-                'active_trade_proposal': getattr(self, 'active_trade_proposal', None),
-                'active_request': getattr(self, 'active_request', None)
+                'active_offer': self.active_offer,
+                'active_trade_proposal': self.active_trade_proposal,
+                'active_request': self.active_request
             }
             
             parse_result = parser.parse_npc_response(ai_response, self, player_object, context)
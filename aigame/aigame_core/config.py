@@ -2,6 +2,12 @@
 Global configuration settings for the AI Game.
 """
 
+import logging
+
+from rich import print as rprint
+from rich.style import Style
+from rich.text import Text
+
 # LLM Model Configuration
 DEFAULT_LLM_MODEL = "openai/gpt-4.1-mini"
 
@@ -12,16 +18,24 @@ DEFAULT_LLM_MODEL = "openai/gpt-4.1-mini"
 # DEFAULT_LLM_MODEL = "ollama/llama2"  # For local models
 
 # Game Configuration
-MAX_INTERACTION_HISTORY = 256  # Maximum number of conversation turns to keep
+MAX_INTERACTION_HISTORY = 256  # Maximum number of messages (system, user, assistant and tool) kept in the LLM context window
 
 # Debug Configuration
 LLM_DEBUG_MODE = True  # Set to True to enable LLM invocation tracking
 
+# Third-party loggers that emit records on every LLM request
+EXTERNAL_LOGGERS = ("LiteLLM", "LiteLLM Router", "LiteLLM Proxy", "httpx", "httpcore", "openai")
+
+def silence_external_loggers(level: int = logging.WARNING):
+    """Raise the level of chatty third-party loggers so per-request records are dropped early."""
+    for logger_name in EXTERNAL_LOGGERS:
+        logging.getLogger(logger_name).setLevel(level)
+
+LLM_DEBUG_STYLE = Style.parse("dim bright_blue")
+
 # Debug utility function
 def debug_llm_call(component: str, purpose: str, model: str = None):
     """Print debug information for LLM calls when debug mode is enabled."""
     if LLM_DEBUG_MODE:
-        from rich import print as rprint
-        from rich.text import Text
         model_info = f" [{model}]" if model else ""
-        rprint(Text(f"🤖 LLM Call: {component} → {purpose}{model_info}", style="dim bright_blue")) 
\ No newline at end of file
+        rprint(Text(f"🤖 LLM Call: {component} → {purpose}{model_info}", style=LLM_DEBUG_STYLE)) 
\ No newline at end of file
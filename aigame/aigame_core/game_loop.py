@@ -6,6 +6,7 @@ from rich import print as rprint
 from rich.panel import Panel
 from rich.text import Text
 from rich.console import Console
+from rich.markup import escape
 
 # Core game class imports
 from .player import Player
@@ -19,10 +20,23 @@ console = Console()
 
 # Game constants
 CHARACTERS_BASE_PATH = "aigame/data/characters"
-ITEMS_BASE_PATH = "aigame/data/items"
 LOCATIONS_BASE_PATH = "aigame/data/locations"
 SCENARIOS_BASE_PATH = "aigame/data/scenarios"
 
+AVAILABLE_COMMANDS_TEXT = "\n".join([
+    "[bold cyan]You can interact naturally! Here are some examples:[/bold cyan]",
+    "  [bright_white]Talk:[/bright_white] 'Hello there!' or 'How are you today?'",
+    "  [bright_white]Give items:[/bright_white] 'Here, take my sword' or 'I offer you this potion'",
+    "  [bright_white]Request items:[/bright_white] 'Can I have your map?' or 'I really need that key'",
+    "  [bright_white]Propose trades:[/bright_white] 'I'll trade my coins for your key' or 'Want to swap items?'",
+    "  [bright_white]Accept trades:[/bright_white] 'That sounds good, I accept' or 'Deal!'",
+    "  [bright_white]Decline trades:[/bright_white] 'No thanks' or 'I decline your offer'",
+    "  [bright_white]Get help:[/bright_white] '/help' or 'help'",
+    "  [bright_white]Quit:[/bright_white] '/quit' or 'quit'",
+    "",
+    "[dim]Just type naturally - the AI will understand what you want to do![/dim]",
+])
+
 def load_scenario_and_entities(scenario_name_to_load: str):
     """Loads the specified scenario and all associated game entities (player, NPC, location)."""
     if not isinstance(scenario_name_to_load, str) or not scenario_name_to_load:
@@ -77,12 +91,14 @@ def display_initial_state(player: Player, npc: Character, location: Location):
 # It captures: (dialogue_part) (full_command_part including /give) (item_name_for_give)
 # COMMAND_REGEX = re.compile(r"^(.*?)(?:\s*(\/give\s+(.+)))?$", re.IGNORECASE) # Old regex, no longer needed
 
-def handle_player_action(player1: Player, npc: Character, player_msg: str, current_location: Location) -> bool:
+def handle_player_action(player1: Player, npc: Character, player_msg: str, current_location: Location, parser: InputParser | None = None) -> bool:
     """
     AI-powered version of handle_player_action that uses natural language parsing.
     Returns True if NPC should respond, or special strings for quit/help.
+    Pass a parser to reuse it across turns; a new one is created if omitted.
     """
-    parser = InputParser()
+    if parser is None:
+        parser = InputParser()
     
     # Parse the player input using AI
     parsed_result = parser.parse_player_input(player_msg, player1, npc, current_location)
@@ -343,8 +359,7 @@ def handle_npc_response(npc: Character, player_object: Player, current_location:
         # Error Section (if any errors occurred)
         errors = action_results.get('errors', [])
         if errors:
-            for error in errors:
-                rprint(Text(f"Action error: {error}", style="dim red"))
+            rprint(Text("\n".join(f"Action error: {error}" for error in errors), style="dim red"))
         
         return ai_response
     else:
@@ -398,6 +413,7 @@ def run_interaction_loop(player1: Player, npc: Character, current_location: Loca
     """Handles the main interaction loop between the player and NPC."""
     interaction_count = 0
     game_ended_by_victory = False # Flag to track if victory occurred
+    input_parser = InputParser()
     
     # Display available commands at the start
     display_available_commands()
@@ -475,7 +491,7 @@ def run_interaction_loop(player1: Player, npc: Character, current_location: Loca
             display_available_commands()
             continue
 
-        action_processed_successfully = handle_player_action(player1, npc, player_msg, current_location)
+        action_processed_successfully = handle_player_action(player1, npc, player_msg, current_location, input_parser)
 
         if action_processed_successfully == "TRADE_ACCEPTED" or action_processed_successfully == "TRADE_DECLINED":
             # Trade response was already handled in the command, skip to GM assessment
@@ -579,45 +595,37 @@ def display_final_summary(player1: Player, npc: Character):
     console.line()
     rprint("[bold white]Conversation:[/bold white]")
     
-    full_history = npc.interaction_history.get_llm_history()
+    full_history = npc.interaction_history.get_full_history()
     if not full_history:
         rprint("[dim]No conversation took place[/dim]")
     else:
-        dialogue_turns = []
+        # Speaker prefix per role; names are escaped like the content below
+        speaker_prefixes = {
+            "user": f"[blue]{escape(player1.name)}:[/blue] ",
+            "assistant": f"[green]{escape(npc.name)}:[/green] ",
+        }
+        dialogue_lines = []
         for entry in full_history:
-            if entry["role"] == "user":
+            prefix = speaker_prefixes.get(entry["role"])
+            # Only include messages with actual content; assistant messages with content
+            # are the NPC's spoken dialogue, even if they also carried tool calls
+            if prefix is not None:
                 content = entry.get("content", "")
-                if content:  # Only add if there's actual content
-                    dialogue_turns.append({"speaker": player1.name, "message": content, "style": "blue"})
-            elif entry["role"] == "assistant":
-                content = entry.get("content", "")
-                if content:  # Only include assistant messages that have actual content (spoken responses)
-                    # Include all assistant messages with content, even if they have tool calls
-                    # The content represents the NPC's spoken dialogue
-                    dialogue_turns.append({"speaker": npc.name, "message": content, "style": "green"})
+                if content:
+                    # Escape so stray markup in player/LLM text can't bleed into later lines
+                    dialogue_lines.append(prefix + escape(content))
 
-        if not dialogue_turns:
+        if not dialogue_lines:
             rprint("[dim]No actual dialogue was exchanged[/dim]")
         else:
-            for turn in dialogue_turns:
-                rprint(f"[{turn['style']}]{turn['speaker']}:[/{turn['style']}] {turn['message']}")
+            rprint("\n".join(dialogue_lines))
     
     console.line()
 
 def display_available_commands():
     """Displays natural language examples for the AI-powered input system."""
     console.line()
-    rprint("[bold cyan]You can interact naturally! Here are some examples:[/bold cyan]")
-    rprint("  [bright_white]Talk:[/bright_white] 'Hello there!' or 'How are you today?'")
-    rprint("  [bright_white]Give items:[/bright_white] 'Here, take my sword' or 'I offer you this potion'")
-    rprint("  [bright_white]Request items:[/bright_white] 'Can I have your map?' or 'I really need that key'")
-    rprint("  [bright_white]Propose trades:[/bright_white] 'I'll trade my coins for your key' or 'Want to swap items?'")
-    rprint("  [bright_white]Accept trades:[/bright_white] 'That sounds good, I accept' or 'Deal!'")
-    rprint("  [bright_white]Decline trades:[/bright_white] 'No thanks' or 'I decline your offer'")
-    rprint("  [bright_white]Get help:[/bright_white] '/help' or 'help'")
-    rprint("  [bright_white]Quit:[/bright_white] '/quit' or 'quit'")
-    console.line()
-    rprint("[dim]Just type naturally - the AI will understand what you want to do![/dim]")
+    rprint(AVAILABLE_COMMANDS_TEXT)
     console.line()
 
 def start_game(scenario_name_to_load: str):
@@ -638,7 +646,7 @@ def start_game(scenario_name_to_load: str):
         # This is important so the NPC is aware of how the game started.
         if npc: # Ensure NPC exists before trying to add to its history
             # npc.add_dialogue_turn(speaker="Game Master", message=scenario_introduction) # OLD way
-            npc.interaction_history.add_entry(role="system", content=f"GAME_MASTER_NARRATION: {scenario_introduction}")
+            npc.interaction_history.add_pinned_entry(role="system", content=f"GAME_MASTER_NARRATION: {scenario_introduction}")
 
         display_initial_state(player1, npc, current_location)
         run_interaction_loop(player1, npc, current_location, victory_condition, game_master, scenario_obj)
@@ -18,7 +18,9 @@ console = Console()
 class GameMaster:
     def __init__(self):
         # The GM could have its own personality or instructions, but for now, it's a neutral evaluator.
-        pass
+        # Victory verdicts keyed by the formatted game state. Evaluation runs at temperature 0,
+        # so a turn that leaves items and disposition unchanged can reuse the previous verdict.
+        self._victory_cache: dict[str, tuple[bool, str]] = {}
 
     def introduce_scenario(self, scenario: Scenario) -> str:
         """
@@ -51,7 +53,7 @@ class GameMaster:
         )
         
         # Add scenario setting if available
-        if hasattr(scenario, 'setting') and scenario.setting:
+        if scenario.setting:
             user_prompt += f"\nWorld Setting: {scenario.setting}"
 
         messages = [
@@ -94,7 +96,7 @@ class GameMaster:
         if scenario:
             # Build scenario setting context
             setting_context = ""
-            if hasattr(scenario, 'setting') and scenario.setting:
+            if scenario.setting:
                 setting_context = (
                     f"- World Setting: {scenario.setting}\n"
                     f"- This world context should inform how characters react emotionally and socially. "
@@ -297,6 +299,10 @@ class GameMaster:
         """
         state_prompt = self._format_state_for_llm(player, npc, victory_condition)
 
+        cached_verdict = self._victory_cache.get(state_prompt)
+        if cached_verdict is not None:
+            return cached_verdict
+
         system_message = (
             "You are a meticulous Game Master AI. Your task is to evaluate if a specific victory condition "
             "has been met based on the current game state provided. "
@@ -335,6 +341,8 @@ class GameMaster:
                 if not isinstance(result, bool):
                     return False, "Game Master evaluation failed - invalid result format."
                 
+                # Only successful evaluations are cached; failures are retried next turn
+                self._victory_cache[state_prompt] = (result, reasoning)
                 return result, reasoning
                 
             except json.JSONDecodeError as e:
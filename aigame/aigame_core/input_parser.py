@@ -45,8 +45,9 @@ class InputParser:
             }
         
         # Backward compatibility: Handle slash commands directly
-        if player_input.strip().startswith('/'):
-            return self._parse_slash_command(player_input.strip(), player, npc)
+        stripped_input = player_input.strip()
+        if stripped_input.startswith('/'):
+            return self._parse_slash_command(stripped_input, player, npc)
         
         # Step 1: Classify the input type
         classification = self._classify_input(player_input, player, npc, current_location)
@@ -586,7 +587,7 @@ class InputParser:
         return {
             'action_type': 'accept_trade',
             'parameters': {
-                'custom_message': player_input.strip() if player_input.strip() else None
+                'custom_message': player_input.strip() or None
             },
             'success': True,
             'error_message': '',
@@ -622,7 +623,7 @@ class InputParser:
         return {
             'action_type': 'decline_trade',
             'parameters': {
-                'custom_message': player_input.strip() if player_input.strip() else None
+                'custom_message': player_input.strip() or None
             },
             'success': True,
             'error_message': '',
@@ -1,10 +1,13 @@
 from __future__ import annotations
+from collections import deque
 from typing import Literal, TypedDict, overload
 
 # Rich imports
 from rich import print as rprint
 from rich.text import Text
 
+from .config import MAX_INTERACTION_HISTORY
+
 class MessageEntry(TypedDict):
     role: Literal["system", "user", "assistant", "tool"]
     content: str
@@ -14,8 +17,16 @@ class MessageEntry(TypedDict):
     tool_calls: list[dict] | None # Optional, only for role 'assistant' if it requests tool calls
 
 class InteractionHistory:
-    def __init__(self):
-        self._history: list[MessageEntry] = []
+    def __init__(self, max_entries: int = MAX_INTERACTION_HISTORY):
+        # The LLM window is bounded by message count (every system, user, assistant
+        # and tool entry counts) so long conversations don't grow every prompt
+        # without limit; the oldest messages are dropped once it is full.
+        self._history: deque[MessageEntry] = deque(maxlen=max_entries)
+        # Pinned entries (e.g. the scenario introduction) are never evicted and
+        # always lead the LLM history.
+        self._pinned: list[MessageEntry] = []
+        # Unbounded record of everything added, for end-of-game summaries.
+        self._transcript: list[MessageEntry] = []
 
     @overload
     def add_entry(self, role: Literal["system", "user", "assistant"], content: str, tool_calls: list[dict] | None = None) -> None:
@@ -62,17 +73,37 @@ class InteractionHistory:
 
         try:
             self._history.append(entry)
+            self._transcript.append(entry)
         except Exception as e:
             rprint(f"[bold red]Error adding to interaction history: {e}[/bold red]")
 
+    def add_pinned_entry(self, role: Literal["system", "user", "assistant"], content: str) -> None:
+        """Adds an entry that is kept at the start of the LLM history and never evicted."""
+        if role not in ["system", "user", "assistant"]:
+            raise ValueError("Role must be one of 'system', 'user', or 'assistant' for pinned entries.")
+        entry: MessageEntry = {"role": role, "content": content}
+        self._pinned.append(entry)
+        self._transcript.append(entry)
+
     def get_llm_history(self) -> list[MessageEntry]:
-        """Returns the history formatted for LLM consumption."""
-        # Directly return the history as it's already in the correct format
-        return list(self._history) # Return a copy
+        """Returns the history formatted for LLM consumption: pinned entries plus the recent window."""
+        history = list(self._history) # Return a copy
+        # If the window cut off an assistant tool call, its tool results can't be
+        # sent on their own, so skip any orphaned leading tool entries.
+        start = 0
+        while start < len(history) and history[start]["role"] == "tool":
+            start += 1
+        return self._pinned + history[start:]
+
+    def get_full_history(self) -> list[MessageEntry]:
+        """Returns every entry added since the last clear, unaffected by the LLM window."""
+        return list(self._transcript)
 
     def clear_history(self) -> None:
         """Clears the interaction history."""
-        self._history = []
+        self._history.clear()
+        self._pinned.clear()
+        self._transcript.clear()
         rprint(Text("Interaction history cleared.", style="dim yellow"))
 
     def add_raw_llm_message(self, message_dump: dict) -> None:
@@ -92,4 +123,5 @@ class InteractionHistory:
         # Cast to MessageEntry for type safety, though it's a structural check
         # This assumes message_dump conforms to MessageEntry structure.
         # More robust validation would involve checking all fields.
-        self._history.append(message_dump) # type: ignore 
\ No newline at end of file
+        self._history.append(message_dump) # type: ignore
+        self._transcript.append(message_dump) # type: ignore 
\ No newline at end of file
@@ -4,6 +4,8 @@ import json
 from rich import print as rprint
 
 class Item:
+    __slots__ = ("name", "description")
+
     def __init__(self, name: str, description: str = ""):
         if not isinstance(name, str) or not name:
             raise ValueError("Item name must be a non-empty string.")
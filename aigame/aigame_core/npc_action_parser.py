@@ -296,8 +296,7 @@ class NPCActionParser:
                 if result['success']:
                     results['executed_actions'].append(action)
                     # Merge state changes
-                    for key, value in result.get('state_changes', {}).items():
-                        results['state_changes'][key] = value
+                    results['state_changes'].update(result.get('state_changes', {}))
                 else:
                     results['errors'].append(result.get('error', 'Unknown execution error'))
             except Exception as e:
@@ -2,7 +2,7 @@ import os
 import sys
 import json
 from aigame.aigame_core.game_loop import start_game
-from aigame.aigame_core.config import LLM_DEBUG_MODE
+from aigame.aigame_core.config import LLM_DEBUG_MODE, silence_external_loggers
 from rich.console import Console
 from rich.text import Text
 from rich.panel import Panel
@@ -44,8 +44,20 @@ def load_json_file(file_path: str) -> dict | None:
     except (FileNotFoundError, json.JSONDecodeError, PermissionError):
         return None
 
-def get_scenario_details(scenario_file: str) -> dict | None:
-    """Loads detailed information about a scenario including character and location data."""
+def get_scenario_details(scenario_file: str, loaded_files: dict[str, dict | None] | None = None) -> dict | None:
+    """Loads detailed information about a scenario including character and location data.
+
+    Pass the same loaded_files dict across one listing so character and location
+    files shared between scenarios are only parsed once.
+    """
+    if loaded_files is None:
+        loaded_files = {}
+
+    def load_shared(path: str) -> dict | None:
+        if path not in loaded_files:
+            loaded_files[path] = load_json_file(path)
+        return loaded_files[path]
+
     scenario_path = os.path.join(SCENARIOS_DIR_PATH, scenario_file)
     scenario_data = load_json_file(scenario_path)
     
@@ -57,9 +69,9 @@ def get_scenario_details(scenario_file: str) -> dict | None:
     npc_char_path = os.path.join(CHARACTERS_DIR_PATH, f"{scenario_data['npc_character_name']}.json")
     location_path = os.path.join(LOCATIONS_DIR_PATH, f"{scenario_data['location_name']}.json")
     
-    player_data = load_json_file(player_char_path)
-    npc_data = load_json_file(npc_char_path)
-    location_data = load_json_file(location_path)
+    player_data = load_shared(player_char_path)
+    npc_data = load_shared(npc_char_path)
+    location_data = load_shared(location_path)
     
     return {
         'scenario': scenario_data,
@@ -226,12 +238,13 @@ def display_scenarios_detailed() -> list[str]:
     # Load and display scenario details
     scenario_names = []
     panels = []
+    loaded_files = {}
     
     for i, filename in enumerate(scenario_files):
         scenario_name = filename[:-5]  # Remove .json extension
         scenario_names.append(scenario_name)
         
-        details = get_scenario_details(filename)
+        details = get_scenario_details(filename, loaded_files)
         panel = create_scenario_panel(scenario_name, details, i + 1)
         panels.append(panel)
     
@@ -311,6 +324,9 @@ def list_and_select_scenario() -> str | None:
     return get_user_selection(scenario_names)
 
 if __name__ == '__main__':
+    # Keep LiteLLM/HTTP client logging out of the game console
+    silence_external_loggers()
+
     # Check for debug mode
     if check_debug_mode():
         enable_debug_mode()